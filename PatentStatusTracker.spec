@@ -34,6 +34,7 @@ a = Analysis(
         'PIL._imagingtk',
         'sqlite3',
         'requests',
+        'brotli',
         'tkinter',
         'tkinter.ttk',
         'tkinter.messagebox',
@@ -72,6 +72,34 @@ class DataTable(ctk.CTkFrame):
         self._rows = rows
         self._refresh_sheet(redraw=True)
 
+    def update_data(self, rows: list[dict[str, Any]], key: str) -> None:
+        """Replace the table data, redrawing only rows whose values changed.
+
+        Rows are matched by `key`. If the set of keys differs from the current
+        data (rows added or removed), falls back to a full `set_data()`.
+        Otherwise each changed row is updated in place at its current display
+        position, so the user's sort order is kept.
+        """
+        old_index = {r.get(key): i for i, r in enumerate(self._rows)}
+        if len(rows) != len(self._rows) or len(old_index) != len(self._rows) or any(
+            r.get(key) not in old_index for r in rows
+        ):
+            self.set_data(rows)
+            return
+
+        changed = False
+        for row in rows:
+            idx = old_index[row.get(key)]
+            current = self._rows[idx]
+            if current is row or current == row:
+                continue
+            self._rows[idx] = row
+            self.sheet.set_row_data(idx, values=self._row_values(row), redraw=False)
+            changed = True
+
+        if changed:
+            self.sheet.refresh()
+
     def get_data(self) -> list[dict[str, Any]]:
         return list(self._rows)
 
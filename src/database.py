@@ -11,6 +11,7 @@ Tables:
     continuity: Parent/child application relationships
     documents: File wrapper documents metadata
     assignments: Ownership assignment records
+    http_cache: Last USPTO response body and validators per request URL
 
 The database uses SQLite with foreign key enforcement and automatic migrations
 for schema updates.
@@ -20,9 +21,29 @@ import sqlite3
 import os
 import json
 import re
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
+
+
+# In-process cache of the settings table. Settings are only written through
+# set_setting(), so the cache stays coherent for the app's lifetime. Missing
+# keys are cached as None so repeated lookups of unset keys also skip SQLite.
+_SETTINGS_CACHE: dict[str, Optional[str]] = {}
+
+# Per-thread connection for an active transaction() block
+_local = threading.local()
+
+# Strips the separators allowed in application numbers ("17/940,142")
+_APP_NUM_TRANS = str.maketrans('', '', '/ ,')
+
+# Minimum number of cached USPTO responses kept in http_cache
+HTTP_CACHE_MAX_ENTRIES = 5000
+
+# Request URLs fetched per tracked patent (application + six sub-endpoints)
+HTTP_CACHE_URLS_PER_PATENT = 7
 
 
 def get_db_path() -> Path:
@@ -38,18 +59,79 @@ def get_db_path() -> Path:
     return documents / "patents.db"
 
 
+class _TransactionConnection:
+    """Connection proxy handed out while a transaction() block is active.
+
+    Delegates everything to the shared connection but ignores commit() and
+    close(), so the module's helpers can be grouped into one transaction
+    without changes.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+
 def get_connection() -> sqlite3.Connection:
     """Get a database connection with row factory and foreign keys enabled.
 
+    Inside a transaction() block on the current thread, returns the
+    transaction's shared connection instead of opening a new one.
+
     Returns:
         sqlite3.Connection: Configured database connection with row factory.
     """
+    active = getattr(_local, "transaction", None)
+    if active is not None:
+        return active
+
     conn = sqlite3.connect(get_db_path())
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
+    # Safe with WAL and avoids an fsync on every commit
+    conn.execute("PRAGMA synchronous = NORMAL")
     return conn
 
 
+@contextmanager
+def transaction():
+    """Run several database calls in a single transaction.
+
+    All module functions called on this thread inside the block share one
+    connection and are committed together (or rolled back on exception).
+    Nested blocks join the outer transaction.
+
+    Example:
+        with db.transaction():
+            db.update_patent(app_num, title=title)
+            db.add_event(patent_id, code, description, date)
+    """
+    if getattr(_local, "transaction", None) is not None:
+        yield
+        return
+
+    conn = get_connection()
+    conn.execute("BEGIN IMMEDIATE")
+    _local.transaction = _TransactionConnection(conn)
+    try:
+        yield
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        _local.transaction = None
+        conn.close()
+
+
 def init_database():
     """Initialize the database schema.
 
@@ -60,6 +142,9 @@ def init_database():
     conn = get_connection()
     cursor = conn.cursor()
 
+    # WAL lets the UI read while the poller writes; the mode persists in the file
+    cursor.execute("PRAGMA journal_mode = WAL")
+
     # Patents table - stores patent applications being tracked
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS patents (
@@ -119,7 +204,8 @@ def migrate_database():
     """Apply schema migrations for new API fields.
 
     Adds new columns to existing tables to support additional USPTO API data.
-    Creates new tables for continuity, documents, and assignments if they don't exist.
+    Creates new tables for continuity, documents, assignments, and the HTTP response
+    cache if they don't exist.
     Safe to run multiple times - skips columns/tables that already exist.
     """
     conn = get_connection()
@@ -248,15 +334,29 @@ def migrate_database():
         )
     """)
 
+    # Create http_cache table (conditional GET validators and bodies)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS http_cache (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            body BLOB,
+            fetched_at TEXT
+        )
+    """)
+
     # Create indexes for new tables
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_continuity_patent_id ON continuity(patent_id)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_documents_patent_id ON documents(patent_id)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_documents_code ON documents(document_code)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_assignments_patent_id ON assignments(patent_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_fetched_at ON http_cache(fetched_at)")
 
     conn.commit()
     conn.close()
 
+    prune_http_cache()
+
 
 def add_patent(application_number: str) -> Optional[int]:
     """Add a new patent to track.
@@ -268,7 +368,7 @@ def add_patent(application_number: str) -> Optional[int]:
         int: The new patent ID if successfully added.
         None: If the patent already exists in the database.
     """
-    app_num = application_number.replace("/", "").replace(" ", "").replace(",", "")
+    app_num = application_number.translate(_APP_NUM_TRANS)
 
     conn = get_connection()
     cursor = conn.cursor()
@@ -290,8 +390,8 @@ def add_patent(application_number: str) -> Optional[int]:
 def remove_patent(application_number: str) -> bool:
     """Remove a patent from tracking.
 
-    Deletes the patent and all related records (events, continuity, documents, assignments)
-    from the database.
+    Deletes the patent and all related records (events, continuity, documents, assignments,
+    cached USPTO responses) from the database.
 
     Args:
         application_number: Patent application number to remove.
@@ -299,7 +399,7 @@ def remove_patent(application_number: str) -> bool:
     Returns:
         bool: True if patent was found and removed, False if not found.
     """
-    app_num = application_number.replace("/", "").replace(" ", "").replace(",", "")
+    app_num = application_number.translate(_APP_NUM_TRANS)
 
     conn = get_connection()
     cursor = conn.cursor()
@@ -315,6 +415,11 @@ def remove_patent(application_number: str) -> bool:
         cursor.execute("DELETE FROM documents WHERE patent_id = ?", (patent_id,))
         cursor.execute("DELETE FROM assignments WHERE patent_id = ?", (patent_id,))
         cursor.execute("DELETE FROM patents WHERE id = ?", (patent_id,))
+        # Cached USPTO responses for the application and its sub-endpoints
+        cursor.execute(
+            "DELETE FROM http_cache WHERE url LIKE ? OR url LIKE ?",
+            (f"%/applications/{app_num}", f"%/applications/{app_num}/%"),
+        )
         conn.commit()
         conn.close()
         return True
@@ -329,14 +434,24 @@ def get_all_patents() -> list:
     Returns:
         list: List of patent dictionaries with all fields, ordered by application number.
     """
+    return list(iter_patents())
+
+
+def iter_patents() -> Iterator[dict[str, Any]]:
+    """Iterate over all tracked patents without materializing the full result set.
+
+    The connection is held open until the iterator is exhausted or closed.
+
+    Yields:
+        dict: Patent dictionaries with all fields, ordered by application number.
+    """
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        SELECT * FROM patents ORDER BY application_number
-    """)
-    patents = [dict(row) for row in cursor.fetchall()]
-    conn.close()
-    return patents
+    try:
+        cursor = conn.execute("SELECT * FROM patents ORDER BY application_number")
+        for row in cursor:
+            yield dict(row)
+    finally:
+        conn.close()
 
 
 def get_patent_by_app_number(application_number: str) -> Optional[dict]:
@@ -349,7 +464,7 @@ def get_patent_by_app_number(application_number: str) -> Optional[dict]:
         dict: Patent data with all fields if found.
         None: If patent not found in database.
     """
-    app_num = application_number.replace("/", "").replace(" ", "").replace(",", "")
+    app_num = application_number.translate(_APP_NUM_TRANS)
 
     conn = get_connection()
     cursor = conn.cursor()
@@ -368,7 +483,7 @@ def update_patent(application_number: str, **kwargs):
         **kwargs: Field names and values to update (e.g., title="New Title").
                   Only allowed fields from the schema will be updated.
     """
-    app_num = application_number.replace("/", "").replace(" ", "").replace(",", "")
+    app_num = application_number.translate(_APP_NUM_TRANS)
 
     conn = get_connection()
     cursor = conn.cursor()
@@ -445,25 +560,46 @@ def add_event(patent_id: int, event_code: str, event_description: str, event_dat
         return False
 
 
-def get_recent_events(days: int = 7, event_types: list[str] | None = None) -> list[dict[str, Any]]:
-    """Get events that occurred at USPTO in the last N days.
+def add_events_bulk(patent_id: int, events: list[dict[str, Any]]) -> int:
+    """Add many events for a patent with a single executemany() call.
+
+    Events that already exist are skipped.
 
     Args:
-        days: Number of days to look back.
-        event_types: Optional list of exact event codes to filter by (e.g., ['CTNF', 'CTFR']).
+        patent_id: Database ID of the patent.
+        events: Parsed event dictionaries with `event_code`, `event_description`,
+                and `event_date` keys.
 
     Returns:
-        list: List of event dictionaries joined with patent application number, title, and applicant.
+        int: Number of events newly added.
     """
     conn = get_connection()
     cursor = conn.cursor()
+    cursor.executemany("""
+        INSERT OR IGNORE INTO events (patent_id, event_code, event_description, event_date)
+        VALUES (?, ?, ?, ?)
+    """, [(patent_id, e['event_code'], e['event_description'], e['event_date']) for e in events])
+    added = cursor.rowcount
+    conn.commit()
+    conn.close()
+    return added
+
+
+def _recent_events_query(
+    select: str, days: int, event_types: list[str] | None
+) -> tuple[str, list[str]]:
+    """Build the recent-events query shared by the get_recent_events* helpers.
+
+    Args:
+        select: Column list for the SELECT clause.
+        days: Number of days to look back.
+        event_types: Optional list of exact event codes to filter by.
 
-    query = """
-        SELECT
-            e.*,
-            p.application_number,
-            p.title,
-            p.applicant
+    Returns:
+        tuple: SQL query string and its parameter list.
+    """
+    query = f"""
+        SELECT {select}
         FROM events e
         JOIN patents p ON e.patent_id = p.id
         WHERE date(e.event_date) >= date('now', ?)
@@ -476,7 +612,25 @@ def get_recent_events(days: int = 7, event_types: list[str] | None = None) -> li
         params.extend(event_types)
 
     query += " ORDER BY e.event_date DESC, p.application_number"
+    return query, params
+
+
+def get_recent_events(days: int = 7, event_types: list[str] | None = None) -> list[dict[str, Any]]:
+    """Get events that occurred at USPTO in the last N days.
+
+    Args:
+        days: Number of days to look back.
+        event_types: Optional list of exact event codes to filter by (e.g., ['CTNF', 'CTFR']).
+
+    Returns:
+        list: List of event dictionaries joined with patent application number, title, and applicant.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
 
+    query, params = _recent_events_query(
+        "e.*, p.application_number, p.title, p.applicant", days, event_types
+    )
     cursor.execute(query, params)
     events = [dict(row) for row in cursor.fetchall()]
     conn.close()
@@ -488,28 +642,43 @@ def get_recent_events_grouped(
 ) -> dict[str, dict[str, Any]]:
     """Get events grouped by application number.
 
+    Events are returned as positional tuples so they can be passed straight to
+    a Treeview row's `values`.
+
     Args:
         days: Number of days to look back.
         event_types: Optional list of exact event codes to filter by.
 
     Returns:
-        dict: Mapping like `{app_number: {'patent': {...}, 'events': [...]}}`.
+        dict: Mapping like `{app_number: {'patent': {...}, 'events': [...]}}`, where
+        each event is an `(event_date, event_code, event_description)` tuple ordered
+        by event date descending.
     """
-    events = get_recent_events(days, event_types)
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    query, params = _recent_events_query(
+        "p.application_number, p.title, p.applicant, "
+        "e.event_date, e.event_code, e.event_description",
+        days, event_types,
+    )
+    cursor.execute(query, params)
+    rows = cursor.fetchall()
+    conn.close()
 
     grouped = {}
-    for event in events:
-        app_num = event['application_number']
-        if app_num not in grouped:
-            grouped[app_num] = {
+    for app_num, title, applicant, *event in rows:
+        group = grouped.get(app_num)
+        if group is None:
+            group = grouped[app_num] = {
                 'patent': {
                     'application_number': app_num,
-                    'title': event['title'],
-                    'applicant': event['applicant']
+                    'title': title,
+                    'applicant': applicant
                 },
                 'events': []
             }
-        grouped[app_num]['events'].append(event)
+        group['events'].append(tuple(event))
 
     return grouped
 
@@ -571,20 +740,31 @@ def get_setting(key: str, default: str | None = None) -> Optional[str]:
         key: Setting key.
         default: Default value to return if the key is not present.
 
+    Values are served from an in-process cache after the first read.
+
     Returns:
         Optional[str]: Stored setting value, or `default` if missing.
     """
+    if key in _SETTINGS_CACHE:
+        value = _SETTINGS_CACHE[key]
+        return value if value is not None else default
+
     conn = get_connection()
     cursor = conn.cursor()
     cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
     row = cursor.fetchone()
     conn.close()
-    return row['value'] if row else default
+
+    value = row['value'] if row else None
+    _SETTINGS_CACHE[key] = value
+    return value if value is not None else default
 
 
 def set_setting(key: str, value: str):
     """Set a setting value.
 
+    Writes through to the in-process settings cache.
+
     Args:
         key: Setting key.
         value: Setting value to store.
@@ -596,6 +776,7 @@ def set_setting(key: str, value: str):
     """, (key, value))
     conn.commit()
     conn.close()
+    _SETTINGS_CACHE[key] = value
 
 
 # ---- Table Preference Helpers (tksheet) ----
@@ -742,31 +923,21 @@ def save_continuity(patent_id: int, parents: list, children: list):
 
     now = datetime.now().isoformat()
 
-    # Insert parent records
-    for parent in parents:
-        cursor.execute("""
-            INSERT INTO continuity
-            (patent_id, relationship_type, related_app_number, related_patent_number,
-             filing_date, status_description, status_code, continuity_type_code,
-             continuity_type_description, first_inventor_to_file, last_updated)
-            VALUES (?, 'parent', ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (patent_id, parent.get('app_number'), parent.get('patent_number'),
-              parent.get('filing_date'), parent.get('status'), parent.get('status_code'),
-              parent.get('continuity_type'), parent.get('continuity_description'),
-              parent.get('first_inventor_to_file'), now))
-
-    # Insert child records
-    for child in children:
-        cursor.execute("""
-            INSERT INTO continuity
-            (patent_id, relationship_type, related_app_number, related_patent_number,
-             filing_date, status_description, status_code, continuity_type_code,
-             continuity_type_description, first_inventor_to_file, last_updated)
-            VALUES (?, 'child', ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (patent_id, child.get('app_number'), child.get('patent_number'),
-              child.get('filing_date'), child.get('status'), child.get('status_code'),
-              child.get('continuity_type'), child.get('continuity_description'),
-              child.get('first_inventor_to_file'), now))
+    # Insert parent and child records in one batch
+    cursor.executemany("""
+        INSERT INTO continuity
+        (patent_id, relationship_type, related_app_number, related_patent_number,
+         filing_date, status_description, status_code, continuity_type_code,
+         continuity_type_description, first_inventor_to_file, last_updated)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, [
+        (patent_id, relationship_type, rel.get('app_number'), rel.get('patent_number'),
+         rel.get('filing_date'), rel.get('status'), rel.get('status_code'),
+         rel.get('continuity_type'), rel.get('continuity_description'),
+         rel.get('first_inventor_to_file'), now)
+        for relationship_type, records in (('parent', parents), ('child', children))
+        for rel in records
+    ])
 
     conn.commit()
     conn.close()
@@ -799,27 +970,30 @@ def get_continuity(patent_id: int) -> dict:
 
 # ---- Documents Table Functions ----
 
-def save_documents(patent_id: int, documents: list):
+def save_documents(patent_id: int, documents: Iterable[dict[str, Any]]):
     """Save document data for a patent (upserts existing data).
 
     Args:
         patent_id: Database ID of the patent.
-        documents: List of parsed document dictionaries.
+        documents: Parsed document dictionaries; any iterable, including a
+            generator, which is consumed as rows are inserted.
     """
     conn = get_connection()
     cursor = conn.cursor()
 
     now = datetime.now().isoformat()
 
-    for doc in documents:
-        cursor.execute("""
-            INSERT OR REPLACE INTO documents
-            (patent_id, document_identifier, document_code, document_description,
-             official_date, direction_category, download_options, page_count, last_updated)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (patent_id, doc.get('document_id'), doc.get('document_code'),
-              doc.get('description'), doc.get('date'), doc.get('direction'),
-              doc.get('download_options'), doc.get('page_count'), now))
+    cursor.executemany("""
+        INSERT OR REPLACE INTO documents
+        (patent_id, document_identifier, document_code, document_description,
+         official_date, direction_category, download_options, page_count, last_updated)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, (
+        (patent_id, doc.get('document_id'), doc.get('document_code'),
+         doc.get('description'), doc.get('date'), doc.get('direction'),
+         doc.get('download_options'), doc.get('page_count'), now)
+        for doc in documents
+    ))
 
     conn.commit()
     conn.close()
@@ -872,19 +1046,21 @@ def save_assignments(patent_id: int, assignments: list):
 
     now = datetime.now().isoformat()
 
-    for assignment in assignments:
-        cursor.execute("""
-            INSERT INTO assignments
-            (patent_id, reel_number, frame_number, reel_frame, page_count,
-             received_date, recorded_date, mailed_date, conveyance_text,
-             assignor_bag, assignee_bag, document_url, last_updated)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (patent_id, assignment.get('reel_number'), assignment.get('frame_number'),
-              assignment.get('reel_frame'), assignment.get('page_count'),
-              assignment.get('received_date'), assignment.get('recorded_date'),
-              assignment.get('mailed_date'), assignment.get('conveyance_text'),
-              assignment.get('assignor_bag'), assignment.get('assignee_bag'),
-              assignment.get('document_url'), now))
+    cursor.executemany("""
+        INSERT INTO assignments
+        (patent_id, reel_number, frame_number, reel_frame, page_count,
+         received_date, recorded_date, mailed_date, conveyance_text,
+         assignor_bag, assignee_bag, document_url, last_updated)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, [
+        (patent_id, assignment.get('reel_number'), assignment.get('frame_number'),
+         assignment.get('reel_frame'), assignment.get('page_count'),
+         assignment.get('received_date'), assignment.get('recorded_date'),
+         assignment.get('mailed_date'), assignment.get('conveyance_text'),
+         assignment.get('assignor_bag'), assignment.get('assignee_bag'),
+         assignment.get('document_url'), now)
+        for assignment in assignments
+    ])
 
     conn.commit()
     conn.close()
@@ -910,3 +1086,83 @@ def get_assignments(patent_id: int) -> list:
     conn.close()
 
     return assignments
+
+
+# ---- HTTP Cache Functions ----
+
+def get_http_cache(url: str) -> Optional[dict]:
+    """Get the cached response for a USPTO request URL.
+
+    Args:
+        url: Full request URL.
+
+    Returns:
+        dict: Dictionary with `etag`, `last_modified` and `body` (bytes).
+        None: If no response is cached for the URL.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT etag, last_modified, body FROM http_cache WHERE url = ?", (url,)
+    )
+    row = cursor.fetchone()
+    conn.close()
+
+    return dict(row) if row else None
+
+
+def save_http_cache(url: str, etag: Optional[str], last_modified: Optional[str], body: bytes):
+    """Store a response body and its validators for a USPTO request URL.
+
+    The cache is bounded separately by `prune_http_cache()`.
+
+    Args:
+        url: Full request URL.
+        etag: `ETag` response header, if any.
+        last_modified: `Last-Modified` response header, if any.
+        body: Raw response body.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("""
+        INSERT OR REPLACE INTO http_cache (url, etag, last_modified, body, fetched_at)
+        VALUES (?, ?, ?, ?, ?)
+    """, (url, etag, last_modified, body, datetime.now().isoformat()))
+    conn.commit()
+    conn.close()
+
+
+def touch_http_cache(url: str):
+    """Mark a cached response as still current (after a 304 Not Modified).
+
+    Args:
+        url: Full request URL.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        "UPDATE http_cache SET fetched_at = ? WHERE url = ?",
+        (datetime.now().isoformat(), url),
+    )
+    conn.commit()
+    conn.close()
+
+
+def prune_http_cache():
+    """Drop the least recently confirmed responses once the cache is too large.
+
+    The limit grows with the library (`HTTP_CACHE_URLS_PER_PATENT` per tracked
+    patent, at least `HTTP_CACHE_MAX_ENTRIES`) so a full poll never evicts
+    responses it is about to revalidate. Run at startup and after each poll.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM patents")
+    limit = max(HTTP_CACHE_MAX_ENTRIES, cursor.fetchone()[0] * HTTP_CACHE_URLS_PER_PATENT)
+    cursor.execute("""
+        DELETE FROM http_cache WHERE url IN (
+            SELECT url FROM http_cache ORDER BY fetched_at DESC LIMIT -1 OFFSET ?
+        )
+    """, (limit,))
+    conn.commit()
+    conn.close()
@@ -25,7 +25,7 @@ logger = logging.getLogger(__name__)
 def _update_patent_from_api(patent_id: int, app_num: str) -> dict[str, Any]:
     """Fetch all supported USPTO endpoints for a single patent and update the database.
 
-    Fetches data from multiple USPTO API endpoints:
+    Fetches data from multiple USPTO API endpoints concurrently:
     - Application data (metadata and events)
     - Patent term adjustment (PTA)
     - Continuity (parent/child relationships)
@@ -43,13 +43,23 @@ def _update_patent_from_api(patent_id: int, app_num: str) -> dict[str, Any]:
             - metadata: Application metadata dictionary
             - new_events: List of newly discovered events
             - total_events: Total number of events in USPTO record
+            - fields: Patent columns written to the database
 
     Raises:
         ValueError: If USPTO response cannot be parsed.
         USPTOApiError: If required API calls fail.
     """
-    raw_data = uspto_api.fetch_application(app_num)
-    parsed = uspto_api.parse_application_data(raw_data)
+    raw = uspto_api.fetch_all(app_num)
+
+    def _result(name: str) -> Any:
+        # fetch_all hands back failures as values; raise them here so each
+        # endpoint keeps its own error handling below.
+        value = raw[name]
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    parsed = uspto_api.parse_application_data(_result("application"))
     if not parsed:
         raise ValueError("Could not parse USPTO response")
 
@@ -61,7 +71,7 @@ def _update_patent_from_api(patent_id: int, app_num: str) -> dict[str, Any]:
 
     # PTA (optional)
     try:
-        pta_raw = uspto_api.fetch_adjustment(app_num)
+        pta_raw = _result("adjustment")
         pta = uspto_api.parse_adjustment_data(pta_raw)
         if pta:
             expiration = uspto_api.calculate_expiration_date(
@@ -77,7 +87,7 @@ def _update_patent_from_api(patent_id: int, app_num: str) -> dict[str, Any]:
 
     # Continuity (optional)
     try:
-        cont_raw = uspto_api.fetch_continuity(app_num)
+        cont_raw = _result("continuity")
         continuity = uspto_api.parse_continuity_data(cont_raw)
         db.save_continuity(patent_id, continuity.get("parents", []), continuity.get("children", []))
     except uspto_api.USPTOApiError as exc:
@@ -87,9 +97,9 @@ def _update_patent_from_api(patent_id: int, app_num: str) -> dict[str, Any]:
 
     # Documents (optional)
     try:
-        docs_raw = uspto_api.fetch_documents(app_num)
-        documents = uspto_api.parse_documents_data(docs_raw)
-        db.save_documents(patent_id, documents)
+        docs_raw = _result("documents")
+        # Stream parsed documents straight into the batched insert
+        db.save_documents(patent_id, uspto_api.iter_documents(docs_raw))
     except uspto_api.USPTOApiError as exc:
         logger.debug("Optional documents fetch failed for %s: %s", app_num, exc)
     except Exception:
@@ -97,7 +107,7 @@ def _update_patent_from_api(patent_id: int, app_num: str) -> dict[str, Any]:
 
     # Assignments (optional)
     try:
-        assign_raw = uspto_api.fetch_assignment(app_num)
+        assign_raw = _result("assignment")
         assignments = uspto_api.parse_assignment_data(assign_raw)
         db.save_assignments(patent_id, assignments)
         update_fields["assignment_bag"] = json.dumps(assignments)
@@ -108,7 +118,7 @@ def _update_patent_from_api(patent_id: int, app_num: str) -> dict[str, Any]:
 
     # Attorney (optional)
     try:
-        attorney_raw = uspto_api.fetch_attorney(app_num)
+        attorney_raw = _result("attorney")
         attorney_json = uspto_api.parse_attorney_data(attorney_raw)
         update_fields["attorney_bag"] = attorney_json
     except uspto_api.USPTOApiError as exc:
@@ -118,7 +128,7 @@ def _update_patent_from_api(patent_id: int, app_num: str) -> dict[str, Any]:
 
     # Foreign Priority (optional)
     try:
-        priority_raw = uspto_api.fetch_foreign_priority(app_num)
+        priority_raw = _result("foreign_priority")
         priority_json = uspto_api.parse_foreign_priority_data(priority_raw)
         update_fields["foreign_priority_bag"] = priority_json
     except uspto_api.USPTOApiError as exc:
@@ -129,22 +139,24 @@ def _update_patent_from_api(patent_id: int, app_num: str) -> dict[str, Any]:
     # Single consolidated update
     db.update_patent(app_num, **update_fields)
 
-    # Add new events
+    # Add new events (one connection and commit for the whole batch)
     new_events: list[dict[str, Any]] = []
-    for event in parsed["events"]:
-        is_new = db.add_event(
-            patent_id,
-            event["event_code"],
-            event["event_description"],
-            event["event_date"],
-        )
-        if is_new:
-            new_events.append(event)
+    with db.transaction():
+        for event in parsed["events"]:
+            is_new = db.add_event(
+                patent_id,
+                event["event_code"],
+                event["event_description"],
+                event["event_date"],
+            )
+            if is_new:
+                new_events.append(event)
 
     return {
         "metadata": metadata,
         "new_events": new_events,
         "total_events": len(parsed["events"]),
+        "fields": update_fields,
     }
 
 
@@ -211,24 +223,34 @@ class PollingService:
         """
         return self._last_poll
 
-    def poll_now(self) -> dict:
+    def poll_now(self, explicit: bool = False) -> dict:
         """Perform an immediate poll of all tracked patents.
 
         Fetches updates for all patents in the database and saves any new events.
         Respects the poll_delay_seconds setting to avoid overwhelming the USPTO API.
 
+        Args:
+            explicit: True for a user-requested refresh. Remembered 404s for
+                optional endpoints are then forgotten so every endpoint is
+                re-checked; background polls keep skipping them.
+
         Returns:
             dict: Dictionary with keys:
                 - success (bool): True if all patents updated successfully
                 - new_events (list): List of new event dictionaries found
                 - errors (list): List of error message strings
                 - updated_patents (int): Number of patents with new events
+                - updated_patent_rows (list): Patent records, re-read from the
+                  database after the update, for every patent successfully refreshed
+                - titles_changed (bool): True if any refreshed patent's title changed
         """
         result = {
             'success': True,
             'new_events': [],
             'errors': [],
-            'updated_patents': 0
+            'updated_patents': 0,
+            'updated_patent_rows': [],
+            'titles_changed': False,
         }
 
         patents = db.get_all_patents()
@@ -241,8 +263,15 @@ class PollingService:
             try:
                 app_num = patent['application_number']
                 patent_id = patent['id']
+                if explicit:
+                    uspto_api.forget_missing(app_num)
                 update = _update_patent_from_api(patent_id, app_num)
                 metadata = update["metadata"]
+                refreshed = db.get_patent_by_app_number(app_num)
+                if refreshed:
+                    result['updated_patent_rows'].append(refreshed)
+                    if refreshed['title'] != patent['title']:
+                        result['titles_changed'] = True
 
                 if update["new_events"]:
                     result['updated_patents'] += 1
@@ -265,6 +294,12 @@ class PollingService:
 
         self._last_poll = datetime.now()
 
+        try:
+            db.prune_http_cache()
+        except Exception:
+            # Trimming the HTTP cache is housekeeping; never fail a poll on it
+            logger.warning("HTTP cache prune failed", exc_info=True)
+
         if result['errors']:
             result['success'] = len(result['errors']) < len(patents)  # Partial success
 
@@ -324,4 +359,5 @@ def refresh_single_patent(application_number: str) -> dict:
 
     patent_id = patent['id']
 
+    uspto_api.forget_missing(app_num)
     return _update_patent_from_api(patent_id, app_num)
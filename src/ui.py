@@ -22,10 +22,12 @@ Key Classes:
 import customtkinter as ctk
 from tkinter import ttk, messagebox
 import webbrowser
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 import json
 import logging
+import time
 
 from . import database as db
 from . import uspto_api
@@ -47,6 +49,25 @@ EVENT_CATEGORIES = {
     "Administrative": ["DOCK", "OIPE", "COMP", "EML_NTF"],
 }
 
+_API_KEY_REQUIRED_MSG = "Please configure your USPTO API key in Settings first."
+
+# Patent fields copied into table rows as-is (None/empty -> "")
+_ROW_STR_KEYS = (
+    "title", "status_date", "patent_number", "expiration_date", "applicant",
+    "examiner", "inventor", "filing_date", "grant_date", "publication_number",
+    "publication_date", "art_unit", "docket_number", "entity_status",
+    "application_type_label", "customer_number", "confirmation_number",
+    "effective_filing_date", "first_inventor_to_file", "last_checked",
+)
+# Same-shape blank row; copying it is cheaper than building a dict from scratch
+_ROW_TEMPLATE = dict.fromkeys(
+    ("application_number", "app_number", "current_status", "pta_total_days") + _ROW_STR_KEYS, ""
+)
+
+# CSV export lookups (PATENT_COLUMNS is static)
+_COLUMNS_BY_KEY = {c["key"]: c for c in PATENT_COLUMNS}
+_HEADER_BY_KEY = {**{k: v["header"] for k, v in _COLUMNS_BY_KEY.items()}, "last_checked": "Last Checked"}
+
 
 class PatentStatusTracker(ctk.CTk):
     """Main application window for Patent Status Tracker.
@@ -77,6 +98,9 @@ class PatentStatusTracker(ctk.CTk):
             on_error=self._on_polling_error
         )
 
+        # Workers for on-demand single-patent refreshes (keeps HTTP off the Tk thread)
+        self._refresh_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="refresh")
+
         # Sorting state for tables
         self.updates_sort_col = None
         self.updates_sort_reverse = False
@@ -94,8 +118,42 @@ class PatentStatusTracker(ctk.CTk):
         except ValueError:
             self._last_valid_days = 7
 
+        # Pending after() id for the debounced days filter change
+        self._days_debounce_id = None
+
+        # (monotonic timestamp, result) of the last credential-store lookup
+        self._api_key_cache = (0.0, False)
+
+        # Set when a refresh is skipped while minimized; replayed on <Map>
+        self._pending_refresh = False
+
+        # Polling updates waiting for the next coalesced refresh (Tk thread only)
+        self._pending_update_events: list = []
+        self._pending_update_id = None
+
+        # Patents context menu, created on first right-click and then reused
+        self._ctx_menu = None
+        self._ctx_menu_buttons = ()
+
         # Event type filter state
         self.selected_event_types = None  # None means show all
+        # Filter value -> event codes; "Other" is filled in lazily from the DB
+        self._event_type_map: dict[str, Optional[tuple[str, ...]]] = {"All": None}
+        self._event_type_map.update((name, tuple(codes)) for name, codes in EVENT_CATEGORIES.items())
+
+        # Updates tree parent-row labels keyed by (app_num, event_count, title);
+        # reset whenever the days/type filter changes
+        self._parent_text_cache: dict[tuple[str, int, Optional[str]], str] = {}
+        self._parent_text_filter = None
+
+        # Patent table rows keyed by app number, tagged with the last_checked
+        # value they were built from (see _patent_to_row)
+        self._row_cache: dict[str, tuple[Optional[str], dict]] = {}
+
+        # Non-default tabs are built on first activation (see _on_tab_changed)
+        self._patents_built = False
+        self._settings_built = False
+        self._api_status = ("", "green")
 
         # Initialize font size and treeview style
         self._init_treeview_style()
@@ -103,6 +161,9 @@ class PatentStatusTracker(ctk.CTk):
         # Build UI
         self._create_widgets()
 
+        # Replay refreshes that were deferred while the window was minimized
+        self.bind("<Map>", self._on_map)
+
         # Check for API key on startup
         self.after(500, self._check_api_key)
 
@@ -113,21 +174,35 @@ class PatentStatusTracker(ctk.CTk):
         """Initialize ttk.Treeview style with configurable font size."""
         self.style = ttk.Style()
         self.font_size = int(db.get_setting("font_size", "10"))
+        self._last_applied_font_size = None
         self._apply_font_size()
 
     def _apply_font_size(self):
-        """Apply font size to treeview widgets."""
-        self.style.configure("Treeview", font=("Segoe UI", self.font_size), rowheight=self.font_size + 12)
-        self.style.configure("Treeview.Heading", font=("Segoe UI", self.font_size, "bold"))
+        """Apply font size to treeview widgets.
+
+        No-op if the size hasn't changed since the last call, so the ttk style
+        isn't re-broadcast to every treeview needlessly.
+        """
+        size = self.font_size
+        if size == self._last_applied_font_size:
+            return
+        self._last_applied_font_size = size
+
+        styles = {
+            "Treeview": {"font": ("Segoe UI", size), "rowheight": size + 12},
+            "Treeview.Heading": {"font": ("Segoe UI", size, "bold")},
+        }
+        for style_name, options in styles.items():
+            self.style.configure(style_name, **options)
         if hasattr(self, "patents_table"):
-            self.patents_table.set_font_size(self.font_size)
+            self.patents_table.set_font_size(size)
 
     def _load_expanded_state(self):
         """Load expanded patents state from settings."""
         expanded_json = db.get_setting("expanded_patents", "[]")
         try:
             self.expanded_patents = set(json.loads(expanded_json))
-        except:
+        except (json.JSONDecodeError, TypeError):
             self.expanded_patents = set()
 
     def _save_expanded_state(self):
@@ -141,7 +216,7 @@ class PatentStatusTracker(ctk.CTk):
         self.grid_rowconfigure(0, weight=1)
 
         # Tabview
-        self.tabview = ctk.CTkTabview(self, corner_radius=10)
+        self.tabview = ctk.CTkTabview(self, corner_radius=10, command=self._on_tab_changed)
         self.tabview.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
 
         # Create tabs
@@ -149,10 +224,8 @@ class PatentStatusTracker(ctk.CTk):
         self.tab_patents = self.tabview.add("All Patents")
         self.tab_settings = self.tabview.add("Settings")
 
-        # Build each tab
+        # Build the default tab now; the others are built on first activation
         self._build_updates_tab()
-        self._build_patents_tab()
-        self._build_settings_tab()
 
         # Status bar
         self.status_frame = ctk.CTkFrame(self, height=30)
@@ -172,6 +245,35 @@ class PatentStatusTracker(ctk.CTk):
         )
         self.last_check_label.pack(side="right", padx=10)
 
+    def _on_tab_changed(self):
+        """Build the selected tab on first activation."""
+        name = self.tabview.get()
+        if name == "All Patents":
+            self._ensure_patents_tab()
+        elif name == "Settings":
+            self._ensure_settings_tab()
+
+    def _ensure_patents_tab(self):
+        """Build and populate the All Patents tab if it hasn't been built yet."""
+        if self._patents_built:
+            return
+        self._patents_built = True
+        self._build_patents_tab()
+        self._load_patents()
+
+    def _ensure_settings_tab(self):
+        """Build the Settings tab if it hasn't been built yet."""
+        if self._settings_built:
+            return
+        self._settings_built = True
+        self._build_settings_tab()
+
+    def _set_api_status(self, text: str, color: str):
+        """Set the API key status text, deferring it if Settings isn't built yet."""
+        self._api_status = (text, color)
+        if self._settings_built:
+            self.api_status_label.configure(text=text, text_color=color)
+
     def _build_updates_tab(self):
         """Build the Updates tab with grouped hierarchical view."""
         self.tab_updates.grid_columnconfigure(0, weight=1)
@@ -452,8 +554,8 @@ class PatentStatusTracker(ctk.CTk):
 
         self.api_status_label = ctk.CTkLabel(
             api_frame,
-            text="",
-            text_color="green"
+            text=self._api_status[0],
+            text_color=self._api_status[1]
         )
         self.api_status_label.pack(anchor="w", padx=15, pady=(0, 15))
 
@@ -547,25 +649,83 @@ class PatentStatusTracker(ctk.CTk):
 
     def _check_api_key(self):
         """Check if API key is configured on startup."""
-        if has_api_key():
-            self.api_status_label.configure(text="API key configured", text_color="green")
+        if self._has_api_key():
+            self._set_api_status("API key configured", "green")
             # Start polling
             interval = int(db.get_setting("poll_interval", "24"))
             self.polling_service.start(interval_minutes=interval * 60)
         else:
-            self.api_status_label.configure(text="No API key - please add one", text_color="orange")
+            self._set_api_status("No API key - please add one", "orange")
             messagebox.showinfo(
                 "Setup Required",
                 "Welcome! Please go to Settings and enter your USPTO API key to get started.\n\n"
                 "You can get a free API key from:\nhttps://data.uspto.gov/apis/getting-started"
             )
+            self._ensure_settings_tab()
             self.tabview.set("Settings")
 
+    def _defer_if_iconified(self) -> bool:
+        """Record a pending refresh and return True if the window is minimized."""
+        if self.state() == "iconic":
+            self._pending_refresh = True
+            return True
+        return False
+
+    def _on_map(self, event):
+        """Run a refresh deferred while the window was minimized."""
+        if event.widget is self and self._pending_refresh:
+            self._pending_refresh = False
+            self._refresh_views()
+
+    def _has_api_key(self) -> bool:
+        """Check for a stored API key, caching the answer for 30 seconds."""
+        now = time.monotonic()
+        checked_at, value = self._api_key_cache
+        if checked_at and now - checked_at < 30:
+            return value
+        value = has_api_key()
+        self._api_key_cache = (now, value)
+        return value
+
     def _refresh_views(self):
-        """Refresh both data views."""
+        """Refresh both data views (deferred until restore if minimized)."""
+        if self._defer_if_iconified():
+            return
+
+        # New events may have introduced codes that belong under "Other"
+        self._event_type_map.pop("Other", None)
         self._load_updates()
         self._load_patents()
 
+    def _refresh_views_delta(self, changed_rows: list[dict], has_new_events: bool,
+                             titles_changed: bool = False):
+        """Refresh views after a poll using only the patents it touched.
+
+        Args:
+            changed_rows: Table rows (from _patent_to_row) for the refreshed patents.
+            has_new_events: Whether the poll inserted any events.
+            titles_changed: Whether any refreshed patent's title changed; the
+                Updates tree shows titles, so it is reloaded as well.
+        """
+        if self._defer_if_iconified():
+            return
+
+        if has_new_events:
+            self._event_type_map.pop("Other", None)
+        if titles_changed:
+            self._parent_text_cache.clear()
+        if has_new_events or titles_changed:
+            self._load_updates()
+
+        if not hasattr(self, "patents_table"):
+            return
+
+        rows_by_app = {r["application_number"]: r for r in self.patents_table.get_data()}
+        for row in changed_rows:
+            if row["application_number"] in rows_by_app:
+                rows_by_app[row["application_number"]] = row
+        self.patents_table.update_data(list(rows_by_app.values()), key="application_number")
+
     def _load_updates(self):
         """Load recent events into the updates table with grouping by application."""
         # Clear existing
@@ -577,13 +737,19 @@ class PatentStatusTracker(ctk.CTk):
         # Get event types to filter based on selection
         event_types = self._get_selected_event_types()
 
+        if (days, event_types) != self._parent_text_filter:
+            self._parent_text_filter = (days, event_types)
+            self._parent_text_cache.clear()
+        parent_text_cache = self._parent_text_cache
+        format_app_number = uspto_api.format_app_number
+
         # Get grouped events
         grouped = db.get_recent_events_grouped(days, event_types)
 
-        # Sort groups by most recent event date
+        # Sort groups by most recent event date (events are already newest-first)
         sorted_groups = sorted(
             grouped.items(),
-            key=lambda x: max(e['event_date'] for e in x[1]['events']) if x[1]['events'] else '',
+            key=lambda x: (x[1]['events'][0][0] or '') if x[1]['events'] else '',
             reverse=True
         )
 
@@ -592,11 +758,15 @@ class PatentStatusTracker(ctk.CTk):
             events = data['events']
 
             # Format display text for parent node
-            formatted_num = uspto_api.format_app_number(app_num)
-            title = patent['title'] or 'Unknown Title'
-            if len(title) > 40:
-                title = title[:37] + "..."
-            parent_text = f"{formatted_num} - {title} ({len(events)})"
+            cache_key = (app_num, len(events), patent['title'])
+            parent_text = parent_text_cache.get(cache_key)
+            if parent_text is None:
+                formatted_num = format_app_number(app_num)
+                title = patent['title'] or 'Unknown Title'
+                if len(title) > 40:
+                    title = title[:37] + "..."
+                parent_text = f"{formatted_num} - {title} ({len(events)})"
+                parent_text_cache[cache_key] = parent_text
 
             # Insert parent node
             parent_id = self.updates_tree.insert(
@@ -607,34 +777,21 @@ class PatentStatusTracker(ctk.CTk):
                 open=app_num in self.expanded_patents
             )
 
-            # Insert child events
+            # Insert child events (rows are already (date, code, description) tuples)
+            child_tags = (app_num, "child")
             for event in events:
-                self.updates_tree.insert(
-                    parent_id, "end",
-                    text="",
-                    values=(
-                        event['event_date'],
-                        event['event_code'],
-                        event['event_description']
-                    ),
-                    tags=(app_num, "child")
-                )
+                self.updates_tree.insert(parent_id, "end", text="", values=event, tags=child_tags)
 
     def _get_selected_event_types(self):
-        """Get list of event codes based on filter selection."""
+        """Get event codes based on filter selection (None means all)."""
         filter_val = self.event_type_var.get()
-        if filter_val == "All":
-            return None
-        elif filter_val in EVENT_CATEGORIES:
-            return EVENT_CATEGORIES[filter_val]
-        elif filter_val == "Other":
-            # Get all codes that aren't in any category
-            all_known = []
-            for codes in EVENT_CATEGORIES.values():
-                all_known.extend(codes)
-            all_codes = db.get_all_event_codes()
-            return [c for c in all_codes if c not in all_known]
-        return None
+        if filter_val == "Other" and "Other" not in self._event_type_map:
+            # All codes that aren't in any category
+            all_known = {c for codes in EVENT_CATEGORIES.values() for c in codes}
+            self._event_type_map["Other"] = tuple(
+                c for c in db.get_all_event_codes() if c not in all_known
+            )
+        return self._event_type_map.get(filter_val)
 
     def _on_event_type_changed(self, value):
         """Handle event type filter change."""
@@ -776,7 +933,7 @@ class PatentStatusTracker(ctk.CTk):
         if visible_json:
             try:
                 visible_cols = json.loads(visible_json)
-            except:
+            except (json.JSONDecodeError, TypeError):
                 visible_cols = [c[0] for c in all_cols]
         else:
             visible_cols = [c[0] for c in all_cols]
@@ -838,41 +995,42 @@ class PatentStatusTracker(ctk.CTk):
             messagebox.showwarning("Invalid", "Please enter a valid number.")
 
     def _patent_to_row(self, patent: dict) -> dict:
-        app_raw = patent.get("application_number") or ""
-        return {
-            "application_number": app_raw,
-            "app_number": uspto_api.format_app_number(app_raw) if app_raw else "",
-            "title": patent.get("title") or "",
-            "current_status": patent.get("current_status") or "Not fetched",
-            "status_date": patent.get("status_date") or "",
-            "patent_number": patent.get("patent_number") or "",
-            "expiration_date": patent.get("expiration_date") or "",
-            "applicant": patent.get("applicant") or "",
-            "examiner": patent.get("examiner") or "",
-            "inventor": patent.get("inventor") or "",
-            "filing_date": patent.get("filing_date") or "",
-            "grant_date": patent.get("grant_date") or "",
-            "publication_number": patent.get("publication_number") or "",
-            "publication_date": patent.get("publication_date") or "",
-            "art_unit": patent.get("art_unit") or "",
-            "docket_number": patent.get("docket_number") or "",
-            "entity_status": patent.get("entity_status") or "",
-            "application_type_label": patent.get("application_type_label") or "",
-            "customer_number": patent.get("customer_number") or "",
-            "confirmation_number": patent.get("confirmation_number") or "",
-            "pta_total_days": patent.get("pta_total_days") if patent.get("pta_total_days") is not None else "",
-            "effective_filing_date": patent.get("effective_filing_date") or "",
-            "first_inventor_to_file": patent.get("first_inventor_to_file") or "",
-            "last_checked": patent.get("last_checked") or "",
-        }
+        """Convert a patent DB record to a table row, reusing the cached row if unchanged.
+
+        Every write path that changes a patent also bumps its last_checked value,
+        so an unchanged (application_number, last_checked) pair means the row is
+        still current.
+        """
+        pget = patent.get
+        app_raw = pget("application_number") or ""
+        last_checked = pget("last_checked")
+        cached = self._row_cache.get(app_raw)
+        if cached is not None and cached[0] == last_checked:
+            return cached[1]
+
+        row = _ROW_TEMPLATE.copy()
+        for k in _ROW_STR_KEYS:
+            v = pget(k)
+            if v:
+                row[k] = v
+        row["application_number"] = app_raw
+        row["app_number"] = uspto_api.format_app_number(app_raw) if app_raw else ""
+        row["current_status"] = pget("current_status") or "Not fetched"
+        # 0 is a meaningful PTA value, so only None maps to ""
+        pta = pget("pta_total_days")
+        row["pta_total_days"] = "" if pta is None else pta
+        self._row_cache[app_raw] = (last_checked, row)
+        return row
 
     def _load_patents(self):
         """Load all patents into the patents table."""
-        patents = db.get_all_patents()
-        rows = [self._patent_to_row(p) for p in patents]
+        if not self._patents_built:
+            return
+
+        rows = [self._patent_to_row(p) for p in db.iter_patents()]
 
         if hasattr(self, "patents_table"):
-            self.patents_table.set_data(rows)
+            self.patents_table.update_data(rows, key="application_number")
 
     def _get_days_value(self) -> int:
         raw = (self.days_var.get() or "").strip()
@@ -885,7 +1043,14 @@ class PatentStatusTracker(ctk.CTk):
             return self._last_valid_days
 
     def _on_days_changed(self, _value=None):
-        """Handle days filter change."""
+        """Handle days filter change, coalescing rapid changes into one reload."""
+        if self._days_debounce_id is not None:
+            self.after_cancel(self._days_debounce_id)
+        self._days_debounce_id = self.after(250, self._apply_days_change)
+
+    def _apply_days_change(self):
+        """Validate and apply the days filter value."""
+        self._days_debounce_id = None
         raw = (self.days_var.get() or "").strip()
         try:
             days = int(raw)
@@ -902,22 +1067,24 @@ class PatentStatusTracker(ctk.CTk):
 
     def _on_refresh_click(self):
         """Handle refresh button click."""
-        if not has_api_key():
-            messagebox.showerror("Error", "Please configure your USPTO API key in Settings first.")
+        if not self._has_api_key():
+            messagebox.showerror("Error", _API_KEY_REQUIRED_MSG)
             return
 
         self.refresh_btn.configure(state="disabled", text="Refreshing...")
         self.status_label.configure(text="Checking USPTO for updates...")
-        self.update()
+        self.update_idletasks()
 
         def do_refresh():
-            result = self.polling_service.poll_now()
-            self.after(0, lambda: self._refresh_complete(result))
+            result = self.polling_service.poll_now(explicit=True)
+            # Build the changed table rows here so that work stays off the Tk thread
+            rows = [self._patent_to_row(p) for p in result['updated_patent_rows']]
+            self.after(0, lambda: self._refresh_complete(result, rows))
 
         import threading
         threading.Thread(target=do_refresh, daemon=True).start()
 
-    def _refresh_complete(self, result):
+    def _refresh_complete(self, result, changed_rows: list[dict]):
         """Handle refresh completion."""
         self.refresh_btn.configure(state="normal", text="Refresh Now")
 
@@ -939,7 +1106,9 @@ class PatentStatusTracker(ctk.CTk):
                 "\n".join(result['errors'][:5])
             )
 
-        self._refresh_views()
+        self._refresh_views_delta(
+            changed_rows, bool(result['new_events']), result['titles_changed']
+        )
 
     def _on_add_patent(self):
         """Handle adding a new patent."""
@@ -947,12 +1116,12 @@ class PatentStatusTracker(ctk.CTk):
         if not app_num:
             return
 
-        if not has_api_key():
-            messagebox.showerror("Error", "Please configure your USPTO API key in Settings first.")
+        if not self._has_api_key():
+            messagebox.showerror("Error", _API_KEY_REQUIRED_MSG)
             return
 
         self.add_btn.configure(state="disabled", text="Adding...")
-        self.update()
+        self.update_idletasks()
 
         try:
             # Try to fetch from USPTO first to validate
@@ -962,40 +1131,33 @@ class PatentStatusTracker(ctk.CTk):
             if not parsed:
                 raise ValueError("Could not parse USPTO response")
 
-            # Add to database
+            # Add the patent, its metadata and all events in one transaction
             normalized = uspto_api.normalize_app_number(app_num)
-            patent_id = db.add_patent(normalized)
+            with db.transaction():
+                patent_id = db.add_patent(normalized)
+
+                if patent_id is not None:
+                    # Update with fetched data
+                    db.update_patent(
+                        normalized,
+                        title=parsed['metadata']['title'],
+                        applicant=parsed['metadata']['applicant'],
+                        inventor=parsed['metadata']['inventor'],
+                        filing_date=parsed['metadata']['filing_date'],
+                        current_status=parsed['metadata']['current_status'],
+                        status_date=parsed['metadata']['status_date'],
+                        examiner=parsed['metadata']['examiner'],
+                        art_unit=parsed['metadata']['art_unit'],
+                        customer_number=parsed['metadata']['customer_number'],
+                        last_checked=datetime.now().isoformat()
+                    )
+
+                    # Add events
+                    db.add_events_bulk(patent_id, parsed['events'])
 
             if patent_id is None:
                 messagebox.showinfo("Info", "This patent is already being tracked.")
             else:
-                # Update with fetched data
-                db.update_patent(
-                    normalized,
-                    title=parsed['metadata']['title'],
-                    applicant=parsed['metadata']['applicant'],
-                    inventor=parsed['metadata']['inventor'],
-                    filing_date=parsed['metadata']['filing_date'],
-                    current_status=parsed['metadata']['current_status'],
-                    status_date=parsed['metadata']['status_date'],
-                    examiner=parsed['metadata']['examiner'],
-                    art_unit=parsed['metadata']['art_unit'],
-                    customer_number=parsed['metadata']['customer_number'],
-                    last_checked=datetime.now().isoformat()
-                )
-
-                # Get the patent ID for adding events
-                patent = db.get_patent_by_app_number(normalized)
-
-                # Add events
-                for event in parsed['events']:
-                    db.add_event(
-                        patent['id'],
-                        event['event_code'],
-                        event['event_description'],
-                        event['event_date']
-                    )
-
                 self.add_entry.delete(0, "end")
                 self._refresh_views()
                 messagebox.showinfo(
@@ -1026,6 +1188,7 @@ class PatentStatusTracker(ctk.CTk):
 
         if messagebox.askyesno("Confirm", f"Remove patent {uspto_api.format_app_number(app_num)} from tracking?"):
             db.remove_patent(app_num)
+            self._row_cache.pop(app_num, None)
             self._refresh_views()
 
     def _on_update_double_click(self, event):
@@ -1051,6 +1214,10 @@ class PatentStatusTracker(ctk.CTk):
 
     def _show_link_dialog(self, app_num: str):
         """Show dialog with links to USPTO sites."""
+        pc_url = uspto_api.get_patent_center_url(app_num)
+        pc_docs_url = uspto_api.get_patent_center_documents_url(app_num)
+        pair_url = uspto_api.get_public_pair_url(app_num)
+
         dialog = ctk.CTkToplevel(self)
         dialog.title("Open in USPTO")
         dialog.geometry("380x220")
@@ -1075,19 +1242,19 @@ class PatentStatusTracker(ctk.CTk):
         ctk.CTkButton(
             btn_frame,
             text="Patent Center",
-            command=lambda: [webbrowser.open(uspto_api.get_patent_center_url(app_num)), dialog.destroy()],
+            command=lambda u=pc_url: [webbrowser.open(u), dialog.destroy()],
         ).pack(fill="x", pady=5)
 
         ctk.CTkButton(
             btn_frame,
             text="Patent Center (Docs)",
-            command=lambda: [webbrowser.open(uspto_api.get_patent_center_documents_url(app_num)), dialog.destroy()],
+            command=lambda u=pc_docs_url: [webbrowser.open(u), dialog.destroy()],
         ).pack(fill="x", pady=5)
 
         ctk.CTkButton(
             btn_frame,
             text="Public PAIR",
-            command=lambda: [webbrowser.open(uspto_api.get_public_pair_url(app_num)), dialog.destroy()],
+            command=lambda u=pair_url: [webbrowser.open(u), dialog.destroy()],
         ).pack(fill="x", pady=5)
 
         ctk.CTkLabel(
@@ -1110,58 +1277,67 @@ class PatentStatusTracker(ctk.CTk):
         if not app_num:
             return
 
-        menu = ctk.CTkToplevel(self)
-        menu.overrideredirect(True)
-        menu.geometry(f"+{event.x_root}+{event.y_root}")
-        menu.transient(self)
+        pc_url = uspto_api.get_patent_center_url(app_num)
+        pc_docs_url = uspto_api.get_patent_center_documents_url(app_num)
+        pair_url = uspto_api.get_public_pair_url(app_num)
 
-        def close_menu():
-            menu.destroy()
+        if self._ctx_menu is None:
+            self._build_patent_context_menu()
 
-        menu.bind("<FocusOut>", lambda e: close_menu())
-
-        ctk.CTkButton(
-            menu,
-            text="Open in Patent Center",
-            command=lambda: [webbrowser.open(uspto_api.get_patent_center_url(app_num)), close_menu()],
-            width=180,
-            anchor="w"
-        ).pack(fill="x")
+        menu = self._ctx_menu
+        close_menu = menu.withdraw
+        pc_btn, pc_docs_btn, pair_btn, refresh_btn = self._ctx_menu_buttons
+        pc_btn.configure(command=lambda u=pc_url: [webbrowser.open(u), close_menu()])
+        pc_docs_btn.configure(command=lambda u=pc_docs_url: [webbrowser.open(u), close_menu()])
+        pair_btn.configure(command=lambda u=pair_url: [webbrowser.open(u), close_menu()])
+        refresh_btn.configure(command=lambda: [self._refresh_single(app_num), close_menu()])
 
-        ctk.CTkButton(
-            menu,
-            text="Open Patent Center (Docs)",
-            command=lambda: [webbrowser.open(uspto_api.get_patent_center_documents_url(app_num)), close_menu()],
-            width=180,
-            anchor="w"
-        ).pack(fill="x")
+        menu.geometry(f"+{event.x_root}+{event.y_root}")
+        menu.deiconify()
+        menu.lift()
+        menu.focus_set()
 
-        ctk.CTkButton(
-            menu,
-            text="Open in Public PAIR",
-            command=lambda: [webbrowser.open(uspto_api.get_public_pair_url(app_num)), close_menu()],
-            width=180,
-            anchor="w"
-        ).pack(fill="x")
+    def _build_patent_context_menu(self):
+        """Create the (initially hidden) patents context menu, reused across right-clicks."""
+        menu = ctk.CTkToplevel(self)
+        menu.withdraw()
+        menu.overrideredirect(True)
+        menu.transient(self)
+        menu.bind("<FocusOut>", lambda e: menu.withdraw())
+
+        buttons = []
+        for text in (
+            "Open in Patent Center",
+            "Open Patent Center (Docs)",
+            "Open in Public PAIR",
+            "Refresh This Patent",
+        ):
+            button = ctk.CTkButton(menu, text=text, width=180, anchor="w")
+            button.pack(fill="x")
+            buttons.append(button)
+
+        self._ctx_menu = menu
+        self._ctx_menu_buttons = tuple(buttons)
 
-        ctk.CTkButton(
-            menu,
-            text="Refresh This Patent",
-            command=lambda: [self._refresh_single(app_num), close_menu()],
-            width=180,
-            anchor="w"
-        ).pack(fill="x")
+    def _refresh_single(self, app_num: str):
+        """Refresh a single patent in the background."""
+        self.status_label.configure(text=f"Refreshing {uspto_api.format_app_number(app_num)}...")
+        future = self._refresh_pool.submit(refresh_single_patent, app_num)
+        future.add_done_callback(
+            lambda f: self.after(0, lambda: self._refresh_single_done(app_num, f))
+        )
 
-        menu.focus_set()
+    def _refresh_single_done(self, app_num: str, future: Future):
+        """Handle completion of a background single-patent refresh (Tk thread)."""
+        exc = future.exception()
+        if exc is not None:
+            self.status_label.configure(text="Ready")
+            messagebox.showerror("Error", str(exc))
+            return
 
-    def _refresh_single(self, app_num: str):
-        """Refresh a single patent."""
-        try:
-            refresh_single_patent(app_num)
-            self._refresh_views()
-            self.status_label.configure(text=f"Refreshed {uspto_api.format_app_number(app_num)}")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        self._row_cache.pop(uspto_api.normalize_app_number(app_num), None)
+        self._refresh_views()
+        self.status_label.configure(text=f"Refreshed {uspto_api.format_app_number(app_num)}")
 
     def _toggle_key_visibility(self):
         """Toggle API key visibility."""
@@ -1179,11 +1355,13 @@ class PatentStatusTracker(ctk.CTk):
             return
 
         self.save_key_btn.configure(state="disabled", text="Validating...")
-        self.update()
+        self.update_idletasks()
 
         # Validate the key
         if uspto_api.validate_api_key(key):
             if store_api_key(key):
+                uspto_api.invalidate_api_key_cache()
+                self._api_key_cache = (time.monotonic(), True)
                 self.api_status_label.configure(text="API key saved and validated!", text_color="green")
                 self.api_key_entry.delete(0, "end")
 
@@ -1221,28 +1399,31 @@ class PatentStatusTracker(ctk.CTk):
         if not filepath:
             return
 
-        patents = db.get_all_patents()
-
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            columns_by_key = {c["key"]: c for c in PATENT_COLUMNS}
-            header_by_key = {k: v["header"] for k, v in columns_by_key.items()}
-            header_by_key["last_checked"] = "Last Checked"
-
+        # Large buffer so the writer isn't flushing to disk every few rows
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
             if hasattr(self, "patents_table"):
-                keys = [k for k in self.patents_table.get_visible_columns() if k in columns_by_key]
+                keys = [k for k in self.patents_table.get_visible_columns() if k in _COLUMNS_BY_KEY]
             else:
-                keys = [c["key"] for c in PATENT_COLUMNS if c.get("default_visible")]
+                # Patents tab not built yet: use the saved table preferences directly
+                prefs = db.load_table_preferences("patents")
+                if prefs:
+                    keys = db.validate_table_preferences(prefs, PATENT_COLUMNS)["visible_columns"]
+                else:
+                    keys = [c["key"] for c in PATENT_COLUMNS if c.get("default_visible")]
 
             # Preserve old export behavior by always including last_checked at the end.
             if "last_checked" not in keys:
                 keys.append("last_checked")
 
-            writer = csv.writer(f)
-            writer.writerow([header_by_key.get(k, k) for k in keys])
+            keys = tuple(keys)
+            patent_to_row = self._patent_to_row
 
-            for patent in patents:
-                row = self._patent_to_row(patent)
-                writer.writerow([row.get(k, "") for k in keys])
+            writer = csv.writer(f)
+            writer.writerow([_HEADER_BY_KEY.get(k, k) for k in keys])
+            writer.writerows(
+                [row.get(k, "") for k in keys]
+                for row in map(patent_to_row, db.iter_patents())
+            )
 
         messagebox.showinfo("Exported", f"Data exported to:\n{filepath}")
 
@@ -1251,7 +1432,17 @@ class PatentStatusTracker(ctk.CTk):
         self.after(0, lambda: self._handle_polling_update(new_events))
 
     def _handle_polling_update(self, new_events):
-        """Handle polling update on main thread."""
+        """Queue a polling update on the main thread, refreshing at most every 500 ms."""
+        self._pending_update_events.extend(new_events)
+        if self._pending_update_id is None:
+            self._pending_update_id = self.after(500, self._flush_polling_updates)
+
+    def _flush_polling_updates(self):
+        """Apply all queued polling updates with a single view refresh."""
+        new_events = self._pending_update_events
+        self._pending_update_events = []
+        self._pending_update_id = None
+
         self._refresh_views()
         self.status_label.configure(text=f"Found {len(new_events)} new events")
 
@@ -1269,6 +1460,7 @@ class PatentStatusTracker(ctk.CTk):
     def on_closing(self):
         """Handle window close."""
         self.polling_service.stop()
+        self._refresh_pool.shutdown(wait=False, cancel_futures=True)
         self.destroy()
 
 
@@ -17,41 +17,292 @@ All functions use the API key stored in Windows Credential Manager via the
 credentials module.
 """
 
+import calendar
 import json
+import logging
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Optional, Dict, List, Any
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Iterator, List, Any
+from datetime import date, datetime
 
+from . import __version__
+from . import database as db
 from .credentials import get_api_key
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; stdlib json gives the same output
+    orjson = None
+
+# Bytes -> object decoder for response bodies
+_loads = orjson.loads if orjson is not None else json.loads
+
 
 USPTO_API_BASE = "https://api.uspto.gov/api/v1/patent/applications"
 
+logger = logging.getLogger(__name__)
+
+# Concurrent USPTO requests issued by fetch_all(); the connection pool below
+# is sized to match so no worker's keep-alive connection gets discarded.
+_FETCH_WORKERS = 16
+
+# Shared session so every endpoint call reuses pooled keep-alive connections
+# instead of paying a TCP + TLS handshake per request. Transient failures
+# (rate limiting, 5xx) are retried with backoff; once retries are exhausted
+# the last response is returned so the normal status handling applies.
+# The session (like orjson) is safe to share across the fetch worker threads.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,  # every request goes to api.uspto.gov
+    pool_maxsize=_FETCH_WORKERS,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,
+    ),
+))
+# Headers common to every request; per-call headers only add the API key.
+# Accept-Encoding is left to requests: it advertises "br" as well as gzip and
+# deflate whenever the brotli package is installed to decode it.
+_SESSION.headers.update({
+    "Accept": "application/json",
+    "User-Agent": f"PatentStatusTracker/{__version__}",
+})
+
+
+# Optional-endpoint URLs that recently returned 404, mapped to when the 404
+# was seen (time.monotonic()). Most applications have no PTA, continuity,
+# assignment, attorney or foreign priority data, so this skips a round-trip
+# per missing sub-resource on background polls. Documents are not memoized
+# since nearly every live application has them. User-initiated refreshes call
+# forget_missing() first so they re-check every endpoint.
+_KNOWN_MISSING_TTL_SECONDS = 24 * 60 * 60
+_known_missing_404: Dict[str, float] = {}
+_known_missing_lock = threading.Lock()
+
+
+# API key read from the credential store; kept until invalidate_api_key_cache()
+# so requests don't each pay a Credential Manager lookup
+_API_KEY_CACHE: Optional[str] = None
+_api_key_lock = threading.Lock()
+
+# (api_key, headers) last built by _get_headers(); stored as one tuple so
+# worker threads never see headers paired with a different key
+_HEADERS_CACHE: Optional[tuple[str, Dict[str, str]]] = None
+
 
 class USPTOApiError(Exception):
     """Custom exception for USPTO API errors."""
     pass
 
 
+def invalidate_api_key_cache() -> None:
+    """Forget the cached API key so the next request re-reads the credential store.
+
+    Call after the stored key changes (e.g. when it is saved in Settings).
+    """
+    global _API_KEY_CACHE
+    with _api_key_lock:
+        _API_KEY_CACHE = None
+
+
+def _cached_api_key() -> Optional[str]:
+    """Return the stored API key, reading the credential store only on a cache miss."""
+    global _API_KEY_CACHE
+    api_key = _API_KEY_CACHE
+    if api_key is None:
+        with _api_key_lock:
+            if _API_KEY_CACHE is None:
+                _API_KEY_CACHE = get_api_key()
+            api_key = _API_KEY_CACHE
+    return api_key
+
+
 def _get_headers() -> Dict[str, str]:
     """Get headers with API key for USPTO requests.
 
+    The dict is built once and reused until the stored API key changes, so
+    callers must copy it before adding headers of their own.
+
     Returns:
-        Dict[str, str]: Request headers with X-API-Key and Accept fields.
+        Dict[str, str]: Request headers with the X-API-Key field (Accept and
+        User-Agent come from the session defaults).
 
     Raises:
         USPTOApiError: If no API key is configured.
     """
-    api_key = get_api_key()
+    global _HEADERS_CACHE
+
+    api_key = _cached_api_key()
     if not api_key:
         raise USPTOApiError("No API key configured. Please add your USPTO API key in Settings.")
 
-    return {
-        "X-API-Key": api_key,
-        "Accept": "application/json"
-    }
+    cached = _HEADERS_CACHE
+    if cached is not None and cached[0] == api_key:
+        return cached[1]
+
+    headers = {"X-API-Key": api_key}
+    _HEADERS_CACHE = (api_key, headers)
+    return headers
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a value to a JSON string for DB storage (compact, UTF-8)."""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+
+# Serialized form of an empty bag, shared instead of re-encoding [] each time
+_EMPTY_BAG = '[]'
+
+
+def _dumps_bag(value: Any) -> str:
+    """Serialize a USPTO bag for DB storage, skipping the encoder when empty.
+
+    Missing or null bags are stored as an empty list.
+    """
+    return _dumps(value) if value else _EMPTY_BAG
+
+
+# Longest slice of an error response body quoted in USPTOApiError messages
+_ERROR_EXCERPT_BYTES = 512
+
+
+def _error_excerpt(response: requests.Response) -> str:
+    """Decode only the start of an error response body for an error message."""
+    return response.content[:_ERROR_EXCERPT_BYTES].decode('utf-8', 'replace')
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """Decode a USPTO JSON response body.
+
+    Parses the raw body bytes (with orjson when available) so every endpoint
+    shares one fast decode path. Non-JSON responses (e.g. an HTML error page from a proxy) and
+    invalid JSON both surface as a USPTOApiError.
+
+    Args:
+        response: Successful USPTO API response.
+
+    Returns:
+        Any: Decoded JSON payload.
+
+    Raises:
+        USPTOApiError: If the response is not JSON or the body is not valid JSON.
+    """
+    content_type = response.headers.get('Content-Type', '')
+    if content_type and 'json' not in content_type.lower():
+        raise USPTOApiError(f"Unexpected USPTO API response type: {content_type}")
+
+    try:
+        return _loads(response.content)
+    except ValueError as e:
+        raise USPTOApiError(f"Invalid JSON in USPTO API response: {e}")
+
+
+def _conditional_get(
+    url: str, timeout: int = 30, remember_404: bool = False
+) -> requests.Response:
+    """GET a USPTO URL, revalidating any cached copy of the response.
+
+    Sends `If-None-Match` / `If-Modified-Since` from the last 200 response for
+    this URL. A 304 is turned into a 200 carrying the cached body, so callers
+    handle it like a fresh response without the body being re-downloaded.
+    New 200 responses that carry a validator are cached; errors never are.
+
+    Args:
+        url: Full request URL.
+        timeout: Request timeout in seconds.
+        remember_404: If True, a 404 for this URL is remembered for
+            `_KNOWN_MISSING_TTL_SECONDS` and answered locally until then.
+
+    Returns:
+        requests.Response: The server response, the cached one on 304, or a
+        bodiless 404 response for a remembered missing resource.
+    """
+    if remember_404:
+        with _known_missing_lock:
+            seen = _known_missing_404.get(url)
+            if seen is not None and time.monotonic() - seen >= _KNOWN_MISSING_TTL_SECONDS:
+                del _known_missing_404[url]
+                seen = None
+        if seen is not None:
+            response = requests.Response()
+            response.status_code = 404
+            response.url = url
+            return response
+
+    headers = _get_headers()
+    try:
+        cached = db.get_http_cache(url)
+    except sqlite3.Error:
+        # The cache is an optimization; fetch unconditionally without it
+        logger.warning("HTTP cache lookup failed for %s", url, exc_info=True)
+        cached = None
+    if cached:
+        headers = dict(headers)
+        if cached['etag']:
+            headers['If-None-Match'] = cached['etag']
+        if cached['last_modified']:
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    response = _SESSION.get(url, headers=headers, timeout=timeout)
+
+    if response.status_code == 304 and cached:
+        response.status_code = 200
+        response._content = cached['body']
+        try:
+            db.touch_http_cache(url)
+        except sqlite3.Error:
+            logger.warning("HTTP cache update failed for %s", url, exc_info=True)
+    elif response.status_code == 200:
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            try:
+                db.save_http_cache(url, etag, last_modified, response.content)
+            except sqlite3.Error:
+                # e.g. "database is locked" while a refresh holds a write
+                # transaction; the response itself is still good
+                logger.warning("HTTP cache write failed for %s", url, exc_info=True)
+    elif response.status_code == 404 and remember_404:
+        with _known_missing_lock:
+            _known_missing_404[url] = time.monotonic()
+
+    return response
+
+
+def forget_missing(application_number: str) -> None:
+    """Forget remembered sub-endpoint 404s so the next fetch re-checks them.
+
+    Call before a user-initiated refresh, so data that appeared since the
+    last 404 (e.g. a new PTA or assignment record) is picked up immediately.
+
+    Args:
+        application_number: Application number in any format.
+    """
+    prefix = f"{USPTO_API_BASE}/{normalize_app_number(application_number)}/"
+    with _known_missing_lock:
+        for url in [u for u in _known_missing_404 if u.startswith(prefix)]:
+            del _known_missing_404[url]
+
+
+# Deletion table for the separators allowed in application numbers
+_APP_NUM_TRANS = str.maketrans('', '', '/ ,')
+
+# normalize_app_number, format_app_number and the Patent Center / Public PAIR
+# URL builders below are pure string functions memoized with lru_cache. The
+# caches are per process and bounded at 4096 entries each.
 
 
+@lru_cache(maxsize=4096)
 def normalize_app_number(app_number: str) -> str:
     """Normalize application number by removing slashes, spaces, and commas.
 
@@ -61,9 +312,10 @@ def normalize_app_number(app_number: str) -> str:
     Returns:
         str: Normalized application number (e.g., "17940142").
     """
-    return str(app_number).replace("/", "").replace(" ", "").replace(",", "")
+    return str(app_number).translate(_APP_NUM_TRANS)
 
 
+@lru_cache(maxsize=4096)
 def format_app_number(app_number: str) -> str:
     """Format application number for display (e.g., 17/940,142).
 
@@ -94,20 +346,18 @@ def fetch_application(application_number: str) -> Dict[str, Any]:
     app_num = normalize_app_number(application_number)
 
     try:
-        response = requests.get(
-            f"{USPTO_API_BASE}/{app_num}",
-            headers=_get_headers(),
-            timeout=30
-        )
+        response = _conditional_get(f"{USPTO_API_BASE}/{app_num}")
 
         if response.status_code == 401:
+            # The stored key may have changed outside the app; re-read it next time
+            invalidate_api_key_cache()
             raise USPTOApiError("Invalid API key. Please check your USPTO API key in Settings.")
         elif response.status_code == 404:
             raise USPTOApiError(f"Application {format_app_number(app_num)} not found.")
         elif response.status_code != 200:
-            raise USPTOApiError(f"USPTO API error: {response.status_code} - {response.text}")
+            raise USPTOApiError(f"USPTO API error: {response.status_code} - {_error_excerpt(response)}")
 
-        data = response.json()
+        data = _decode_json(response)
 
         if data.get('count', 0) == 0:
             raise USPTOApiError(f"Application {format_app_number(app_num)} not found.")
@@ -122,6 +372,50 @@ def fetch_application(application_number: str) -> Dict[str, Any]:
         raise USPTOApiError(f"Request error: {str(e)}")
 
 
+# (output key, applicationMetaData key, default) for fields copied as-is
+_META_FIELDS: tuple[tuple[str, str, Any], ...] = (
+    ('title', 'inventionTitle', ''),
+    ('filing_date', 'filingDate', ''),
+    ('current_status', 'applicationStatusDescriptionText', ''),
+    ('status_date', 'applicationStatusDate', ''),
+    ('examiner', 'examinerNameText', ''),
+    ('art_unit', 'groupArtUnitNumber', ''),
+    # Grant & Publication
+    ('patent_number', 'patentNumber', ''),
+    ('grant_date', 'grantDate', ''),
+    ('publication_number', 'earliestPublicationNumber', ''),
+    ('publication_date', 'earliestPublicationDate', ''),
+    # PCT / International
+    ('pct_publication_number', 'pctPublicationNumber', ''),
+    ('pct_publication_date', 'pctPublicationDate', ''),
+    ('international_registration_number', 'internationalRegistrationNumber', ''),
+    ('international_registration_publication_date', 'internationalRegistrationPublicationDate', ''),
+    # Application Type & Classification
+    ('application_type_code', 'applicationTypeCode', ''),
+    ('application_type_label', 'applicationTypeLabelName', ''),
+    ('application_type_category', 'applicationTypeCategory', ''),
+    ('uspc_class', 'class', ''),
+    ('uspc_subclass', 'subclass', ''),
+    ('uspc_symbol', 'uspcSymbolText', ''),
+    # Filing & Docket
+    ('docket_number', 'docketNumber', ''),
+    ('effective_filing_date', 'effectiveFilingDate', ''),
+    ('first_inventor_to_file', 'firstInventorToFileIndicator', ''),
+    # Status code
+    ('status_code', 'applicationStatusCode', None),
+)
+
+# (output key, applicationMetaData key) for nested bags stored as JSON strings
+_BAG_FIELDS: tuple[tuple[str, str], ...] = (
+    ('publication_date_bag', 'publicationDateBag'),
+    ('publication_sequence_number_bag', 'publicationSequenceNumberBag'),
+    ('publication_category_bag', 'publicationCategoryBag'),
+    ('cpc_classification_bag', 'cpcClassificationBag'),
+    ('applicant_bag', 'applicantBag'),
+    ('inventor_bag', 'inventorBag'),
+)
+
+
 def parse_application_data(raw_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Parse raw USPTO application response into metadata and events.
 
@@ -140,89 +434,50 @@ def parse_application_data(raw_data: Dict[str, Any]) -> Optional[Dict[str, Any]]
 
     wrapper = bag[0]
     metadata = wrapper.get('applicationMetaData', {})
+    # Bound once: metadata is read ~40 times below
+    mget = metadata.get
 
     # Extract inventor names (for display)
-    inventors = []
-    for inv in metadata.get('inventorBag', []):
-        name = inv.get('inventorNameText', '')
-        if name:
-            inventors.append(name)
+    inventors = [
+        name for inv in mget('inventorBag', [])
+        if (name := inv.get('inventorNameText', ''))
+    ]
 
     # Extract applicant (for display)
-    applicants = []
-    for app in metadata.get('applicantBag', []):
-        name = app.get('applicantNameText', '')
-        if name:
-            applicants.append(name)
+    applicants = [
+        name for app in mget('applicantBag', [])
+        if (name := app.get('applicantNameText', ''))
+    ]
 
     # Entity status data
-    entity_data = metadata.get('entityStatusData', {})
+    entity_data = mget('entityStatusData', {})
 
     # Parse events
-    events = []
-    for event in wrapper.get('eventDataBag', []):
-        events.append({
+    events = [
+        {
             'event_code': event.get('eventCode', ''),
             'event_description': event.get('eventDescriptionText', ''),
             'event_date': event.get('eventDate', '')
-        })
+        }
+        for event in wrapper.get('eventDataBag', [])
+    ]
+
+    out = {k: mget(src, default) for k, src, default in _META_FIELDS}
+    dumps_bag = _dumps_bag
+    out.update((k, dumps_bag(mget(src))) for k, src in _BAG_FIELDS)
+
+    # Fields that don't map 1:1 onto a metadata key
+    out['application_number'] = wrapper.get('applicationNumberText', '')
+    out['applicant'] = applicants[0] if applicants else ''
+    out['inventor'] = ', '.join(inventors)
+    out['customer_number'] = str(mget('customerNumber', ''))
+    out['confirmation_number'] = str(mget('applicationConfirmationNumber', ''))
+    out['national_stage_indicator'] = 1 if mget('nationalStageIndicator') else 0
+    out['entity_status'] = entity_data.get('businessEntityStatusCategory', '')
+    out['small_entity_indicator'] = 1 if entity_data.get('smallEntityStatusIndicator') else 0
 
     return {
-        'metadata': {
-            # Original fields
-            'application_number': wrapper.get('applicationNumberText', ''),
-            'title': metadata.get('inventionTitle', ''),
-            'applicant': applicants[0] if applicants else '',
-            'inventor': ', '.join(inventors),
-            'filing_date': metadata.get('filingDate', ''),
-            'current_status': metadata.get('applicationStatusDescriptionText', ''),
-            'status_date': metadata.get('applicationStatusDate', ''),
-            'examiner': metadata.get('examinerNameText', ''),
-            'art_unit': metadata.get('groupArtUnitNumber', ''),
-            'customer_number': str(metadata.get('customerNumber', '')),
-
-            # Grant & Publication
-            'patent_number': metadata.get('patentNumber', ''),
-            'grant_date': metadata.get('grantDate', ''),
-            'publication_number': metadata.get('earliestPublicationNumber', ''),
-            'publication_date': metadata.get('earliestPublicationDate', ''),
-            'publication_date_bag': json.dumps(metadata.get('publicationDateBag', [])),
-            'publication_sequence_number_bag': json.dumps(metadata.get('publicationSequenceNumberBag', [])),
-            'publication_category_bag': json.dumps(metadata.get('publicationCategoryBag', [])),
-
-            # PCT / International
-            'pct_publication_number': metadata.get('pctPublicationNumber', ''),
-            'pct_publication_date': metadata.get('pctPublicationDate', ''),
-            'international_registration_number': metadata.get('internationalRegistrationNumber', ''),
-            'international_registration_publication_date': metadata.get('internationalRegistrationPublicationDate', ''),
-            'national_stage_indicator': 1 if metadata.get('nationalStageIndicator') else 0,
-
-            # Application Type & Classification
-            'application_type_code': metadata.get('applicationTypeCode', ''),
-            'application_type_label': metadata.get('applicationTypeLabelName', ''),
-            'application_type_category': metadata.get('applicationTypeCategory', ''),
-            'uspc_class': metadata.get('class', ''),
-            'uspc_subclass': metadata.get('subclass', ''),
-            'uspc_symbol': metadata.get('uspcSymbolText', ''),
-            'cpc_classification_bag': json.dumps(metadata.get('cpcClassificationBag', [])),
-
-            # Filing & Docket
-            'docket_number': metadata.get('docketNumber', ''),
-            'confirmation_number': str(metadata.get('applicationConfirmationNumber', '')),
-            'effective_filing_date': metadata.get('effectiveFilingDate', ''),
-            'first_inventor_to_file': metadata.get('firstInventorToFileIndicator', ''),
-
-            # Entity Status
-            'entity_status': entity_data.get('businessEntityStatusCategory', ''),
-            'small_entity_indicator': 1 if entity_data.get('smallEntityStatusIndicator') else 0,
-
-            # Status code
-            'status_code': metadata.get('applicationStatusCode'),
-
-            # Raw JSON storage for complex/nested data
-            'applicant_bag': json.dumps(metadata.get('applicantBag', [])),
-            'inventor_bag': json.dumps(metadata.get('inventorBag', [])),
-        },
+        'metadata': out,
         'events': events
     }
 
@@ -230,26 +485,31 @@ def parse_application_data(raw_data: Dict[str, Any]) -> Optional[Dict[str, Any]]
 def validate_api_key(api_key: str) -> bool:
     """Validate an API key by making a test request.
 
+    Sends a HEAD request so only the status line comes back. Only 200 and 401
+    are taken as a verdict; anything else (gateways often answer HEAD on
+    GET-only routes with 403 or 405) falls back to a streamed GET that is
+    closed without reading the body.
+
     Args:
         api_key: Candidate USPTO Open Data Portal API key.
 
     Returns:
         bool: True if the key appears valid, False otherwise.
     """
+    url = f"{USPTO_API_BASE}/17940142"  # Test with a known application
+    headers = {"X-API-Key": api_key}
     try:
-        response = requests.get(
-            f"{USPTO_API_BASE}/17940142",  # Test with a known application
-            headers={
-                "X-API-Key": api_key,
-                "Accept": "application/json"
-            },
-            timeout=15
-        )
-        return response.status_code == 200
+        response = _SESSION.head(url, headers=headers, timeout=15, allow_redirects=True)
+        if response.status_code in (200, 401):
+            return response.status_code == 200
+
+        with _SESSION.get(url, headers=headers, timeout=15, stream=True) as response:
+            return response.status_code == 200
     except requests.exceptions.RequestException:
         return False
 
 
+@lru_cache(maxsize=4096)
 def get_patent_center_url(application_number: str) -> str:
     """Get the Patent Center URL for an application.
 
@@ -263,6 +523,7 @@ def get_patent_center_url(application_number: str) -> str:
     return f"https://patentcenter.uspto.gov/applications/{app_num}"
 
 
+@lru_cache(maxsize=4096)
 def get_patent_center_documents_url(application_number: str) -> str:
     """Get a Patent Center documents URL for an application.
 
@@ -278,6 +539,7 @@ def get_patent_center_documents_url(application_number: str) -> str:
     return f"https://patentcenter.uspto.gov/applications/{app_num}/ifw/docs"
 
 
+@lru_cache(maxsize=4096)
 def get_public_pair_url(application_number: str) -> str:
     """Get the Public PAIR URL for an application.
 
@@ -308,18 +570,14 @@ def fetch_adjustment(application_number: str) -> Dict[str, Any]:
     app_num = normalize_app_number(application_number)
 
     try:
-        response = requests.get(
-            f"{USPTO_API_BASE}/{app_num}/adjustment",
-            headers=_get_headers(),
-            timeout=30
-        )
+        response = _conditional_get(f"{USPTO_API_BASE}/{app_num}/adjustment", remember_404=True)
 
         if response.status_code == 404:
             return {}  # No PTA data available
         elif response.status_code != 200:
             raise USPTOApiError(f"Adjustment API error: {response.status_code}")
 
-        return response.json()
+        return _decode_json(response)
     except requests.exceptions.RequestException as e:
         raise USPTOApiError(f"Adjustment request error: {str(e)}")
 
@@ -345,7 +603,7 @@ def parse_adjustment_data(raw_data: Dict[str, Any]) -> Dict[str, Any]:
         'pta_applicant_delay': raw_data.get('applicantDayDelayQuantity', 0),
         'pta_overlap_delay': raw_data.get('overlappingDayQuantity', 0),
         'pta_non_overlap_delay': raw_data.get('nonOverlappingDayQuantity', 0),
-        'pta_history_bag': json.dumps(raw_data.get('patentTermAdjustmentHistoryDataBag', [])),
+        'pta_history_bag': _dumps_bag(raw_data.get('patentTermAdjustmentHistoryDataBag')),
     }
 
 
@@ -364,18 +622,21 @@ def calculate_expiration_date(filing_date: str, pta_days: int) -> str:
         return ''
 
     try:
-        filing = datetime.strptime(filing_date, '%Y-%m-%d')
-        # Add 20 years (handle leap day safely)
-        try:
-            expiration = filing.replace(year=filing.year + 20)
-        except ValueError:
-            if filing.month == 2 and filing.day == 29:
-                expiration = filing.replace(year=filing.year + 20, day=28)
-            else:
-                raise
-        # Add PTA days
-        expiration = expiration + timedelta(days=int(pta_days or 0))
-        return expiration.strftime('%Y-%m-%d')
+        if len(filing_date) == 10 and filing_date[4] == filing_date[7] == '-':
+            # Canonical YYYY-MM-DD: slice the fields instead of parsing a format
+            year, month, day = int(filing_date[:4]), int(filing_date[5:7]), int(filing_date[8:10])
+            date(year, month, day)  # reject impossible filing dates
+        else:
+            # Anything else (e.g. unpadded 2021-1-5) goes through strptime
+            filing = datetime.strptime(filing_date, '%Y-%m-%d')
+            year, month, day = filing.year, filing.month, filing.day
+        # Add 20 years; a Feb 29 filing lands on Feb 28 in a non-leap year
+        year += 20
+        if day == 29 and month == 2 and not calendar.isleap(year):
+            day = 28
+        # Add PTA days as plain integer arithmetic on the day ordinal
+        ordinal = date(year, month, day).toordinal() + int(pta_days or 0)
+        return date.fromordinal(ordinal).isoformat()
     except ValueError:
         return ''
 
@@ -398,18 +659,14 @@ def fetch_continuity(application_number: str) -> Dict[str, Any]:
     app_num = normalize_app_number(application_number)
 
     try:
-        response = requests.get(
-            f"{USPTO_API_BASE}/{app_num}/continuity",
-            headers=_get_headers(),
-            timeout=30
-        )
+        response = _conditional_get(f"{USPTO_API_BASE}/{app_num}/continuity", remember_404=True)
 
         if response.status_code == 404:
             return {'parentContinuityBag': [], 'childContinuityBag': []}
         elif response.status_code != 200:
             raise USPTOApiError(f"Continuity API error: {response.status_code}")
 
-        return response.json()
+        return _decode_json(response)
     except requests.exceptions.RequestException as e:
         raise USPTOApiError(f"Continuity request error: {str(e)}")
 
@@ -424,9 +681,8 @@ def parse_continuity_data(raw_data: Dict[str, Any]) -> Dict[str, list]:
         Dict[str, list]: Dictionary with keys `parents` and `children`, each containing
         a list of relationship dictionaries.
     """
-    parents = []
-    for parent in raw_data.get('parentContinuityBag', []):
-        parents.append({
+    parents = [
+        {
             'app_number': parent.get('parentApplicationNumberText', ''),
             'patent_number': parent.get('parentPatentNumber', ''),
             'filing_date': parent.get('parentApplicationFilingDate', ''),
@@ -435,11 +691,12 @@ def parse_continuity_data(raw_data: Dict[str, Any]) -> Dict[str, list]:
             'continuity_type': parent.get('claimParentageTypeCode', ''),
             'continuity_description': parent.get('claimParentageTypeCodeDescriptionText', ''),
             'first_inventor_to_file': 1 if parent.get('firstInventorToFileIndicator') else 0,
-        })
+        }
+        for parent in raw_data.get('parentContinuityBag', [])
+    ]
 
-    children = []
-    for child in raw_data.get('childContinuityBag', []):
-        children.append({
+    children = [
+        {
             'app_number': child.get('childApplicationNumberText', ''),
             'patent_number': child.get('childPatentNumber', ''),
             'filing_date': child.get('childApplicationFilingDate', ''),
@@ -448,7 +705,9 @@ def parse_continuity_data(raw_data: Dict[str, Any]) -> Dict[str, list]:
             'continuity_type': child.get('claimParentageTypeCode', ''),
             'continuity_description': child.get('claimParentageTypeCodeDescriptionText', ''),
             'first_inventor_to_file': 1 if child.get('firstInventorToFileIndicator') else 0,
-        })
+        }
+        for child in raw_data.get('childContinuityBag', [])
+    ]
 
     return {'parents': parents, 'children': children}
 
@@ -471,18 +730,14 @@ def fetch_documents(application_number: str) -> Dict[str, Any]:
     app_num = normalize_app_number(application_number)
 
     try:
-        response = requests.get(
-            f"{USPTO_API_BASE}/{app_num}/documents",
-            headers=_get_headers(),
-            timeout=30
-        )
+        response = _conditional_get(f"{USPTO_API_BASE}/{app_num}/documents")
 
         if response.status_code == 404:
             return {'documentBag': []}
         elif response.status_code != 200:
             raise USPTOApiError(f"Documents API error: {response.status_code}")
 
-        return response.json()
+        return _decode_json(response)
     except requests.exceptions.RequestException as e:
         raise USPTOApiError(f"Documents request error: {str(e)}")
 
@@ -496,34 +751,52 @@ def parse_documents_data(raw_data: Dict[str, Any]) -> list:
     Returns:
         list: List of document dictionaries for storage and display.
     """
-    documents = []
+    return list(iter_documents(raw_data))
+
+
+def iter_documents(raw_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield parsed document dictionaries one at a time.
+
+    Lets a consumer such as `database.save_documents` write each document as
+    it is parsed instead of holding the full parsed list for large file
+    wrappers.
+
+    Args:
+        raw_data: Raw documents JSON response.
+
+    Yields:
+        Dict[str, Any]: Parsed document dictionary (see `parse_documents_data`).
+    """
     for doc in raw_data.get('documentBag', []):
-        # Store all download options as JSON
-        download_options = doc.get('downloadOptionBag', [])
-
-        # Calculate total page count
-        page_count = 0
-        for option in download_options:
-            if option.get('pageTotalQuantity'):
-                page_count = option.get('pageTotalQuantity')
-                break
-
-        # Parse official date (remove time component if present)
-        official_date = doc.get('officialDate', '')
-        if official_date and 'T' in official_date:
-            official_date = official_date.split('T')[0]
-
-        documents.append({
-            'document_id': doc.get('documentIdentifier', ''),
-            'document_code': doc.get('documentCode', ''),
-            'description': doc.get('documentCodeDescriptionText', ''),
-            'date': official_date,
-            'direction': doc.get('documentDirectionCategory', ''),
-            'download_options': json.dumps(download_options),
-            'page_count': page_count,
-        })
-
-    return documents
+        yield _parse_document(doc)
+
+
+def _parse_document(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse a single documentBag entry (see `parse_documents_data`)."""
+    get = doc.get
+    # Store all download options as JSON
+    download_options = get('downloadOptionBag', [])
+
+    # Page count comes from the first download option that reports one
+    page_count = next(
+        (q for option in download_options if (q := option.get('pageTotalQuantity'))),
+        0,
+    )
+
+    # Parse official date (remove time component if present)
+    official_date = get('officialDate', '')
+    if official_date and 'T' in official_date:
+        official_date = official_date.split('T')[0]
+
+    return {
+        'document_id': get('documentIdentifier', ''),
+        'document_code': get('documentCode', ''),
+        'description': get('documentCodeDescriptionText', ''),
+        'date': official_date,
+        'direction': get('documentDirectionCategory', ''),
+        'download_options': _dumps_bag(download_options),
+        'page_count': page_count,
+    }
 
 
 # ---- Assignment Endpoint ----
@@ -544,18 +817,14 @@ def fetch_assignment(application_number: str) -> Dict[str, Any]:
     app_num = normalize_app_number(application_number)
 
     try:
-        response = requests.get(
-            f"{USPTO_API_BASE}/{app_num}/assignment",
-            headers=_get_headers(),
-            timeout=30
-        )
+        response = _conditional_get(f"{USPTO_API_BASE}/{app_num}/assignment", remember_404=True)
 
         if response.status_code == 404:
             return {'patentAssignmentBag': []}
         elif response.status_code != 200:
             raise USPTOApiError(f"Assignment API error: {response.status_code}")
 
-        return response.json()
+        return _decode_json(response)
     except requests.exceptions.RequestException as e:
         raise USPTOApiError(f"Assignment request error: {str(e)}")
 
@@ -569,9 +838,8 @@ def parse_assignment_data(raw_data: Dict[str, Any]) -> list:
     Returns:
         list: List of assignment dictionaries.
     """
-    assignments = []
-    for assignment in raw_data.get('patentAssignmentBag', []):
-        assignments.append({
+    assignments = [
+        {
             'reel_number': assignment.get('reelNumber', ''),
             'frame_number': assignment.get('frameNumber', ''),
             'reel_frame': assignment.get('reelAndFrameNumber', ''),
@@ -580,10 +848,12 @@ def parse_assignment_data(raw_data: Dict[str, Any]) -> list:
             'recorded_date': assignment.get('assignmentRecordedDate', ''),
             'mailed_date': assignment.get('assignmentMailedDate', ''),
             'conveyance_text': assignment.get('conveyanceText', ''),
-            'assignor_bag': json.dumps(assignment.get('assignorBag', [])),
-            'assignee_bag': json.dumps(assignment.get('assigneeBag', [])),
+            'assignor_bag': _dumps_bag(assignment.get('assignorBag')),
+            'assignee_bag': _dumps_bag(assignment.get('assigneeBag')),
             'document_url': assignment.get('assignmentDocumentLocationURI', ''),
-        })
+        }
+        for assignment in raw_data.get('patentAssignmentBag', [])
+    ]
 
     return assignments
 
@@ -605,18 +875,14 @@ def fetch_attorney(application_number: str) -> Dict[str, Any]:
     app_num = normalize_app_number(application_number)
 
     try:
-        response = requests.get(
-            f"{USPTO_API_BASE}/{app_num}/attorney",
-            headers=_get_headers(),
-            timeout=30
-        )
+        response = _conditional_get(f"{USPTO_API_BASE}/{app_num}/attorney", remember_404=True)
 
         if response.status_code == 404:
             return {}
         elif response.status_code != 200:
             raise USPTOApiError(f"Attorney API error: {response.status_code}")
 
-        return response.json()
+        return _decode_json(response)
     except requests.exceptions.RequestException as e:
         raise USPTOApiError(f"Attorney request error: {str(e)}")
 
@@ -630,7 +896,7 @@ def parse_attorney_data(raw_data: Dict[str, Any]) -> str:
     Returns:
         str: JSON string representation of the attorney response (or `'[]'` if missing).
     """
-    return json.dumps(raw_data) if raw_data else '[]'
+    return _dumps_bag(raw_data)
 
 
 # ---- Foreign Priority Endpoint ----
@@ -651,18 +917,14 @@ def fetch_foreign_priority(application_number: str) -> Dict[str, Any]:
     app_num = normalize_app_number(application_number)
 
     try:
-        response = requests.get(
-            f"{USPTO_API_BASE}/{app_num}/foreign-priority",
-            headers=_get_headers(),
-            timeout=30
-        )
+        response = _conditional_get(f"{USPTO_API_BASE}/{app_num}/foreign-priority", remember_404=True)
 
         if response.status_code == 404:
             return {'foreignPriorityBag': []}
         elif response.status_code != 200:
             raise USPTOApiError(f"Foreign priority API error: {response.status_code}")
 
-        return response.json()
+        return _decode_json(response)
     except requests.exceptions.RequestException as e:
         raise USPTOApiError(f"Foreign priority request error: {str(e)}")
 
@@ -676,7 +938,98 @@ def parse_foreign_priority_data(raw_data: Dict[str, Any]) -> str:
     Returns:
         str: JSON string representation of the foreign priority bag.
     """
-    return json.dumps(raw_data.get('foreignPriorityBag', []))
+    return _dumps_bag(raw_data.get('foreignPriorityBag'))
+
+
+# ---- Combined Fetch ----
+
+# Endpoint fetchers used by fetch_all, keyed by the name used in its result.
+_ENDPOINT_FETCHERS = {
+    'application': fetch_application,
+    'adjustment': fetch_adjustment,
+    'continuity': fetch_continuity,
+    'documents': fetch_documents,
+    'assignment': fetch_assignment,
+    'attorney': fetch_attorney,
+    'foreign_priority': fetch_foreign_priority,
+}
+
+# Worker threads for fetch_all. The endpoint calls are I/O-bound, so threads
+# over the shared session are enough to overlap the round-trips.
+_FETCH_POOL = ThreadPoolExecutor(max_workers=_FETCH_WORKERS, thread_name_prefix="uspto-fetch")
+
+
+def fetch_all(application_number: str) -> Dict[str, Any]:
+    """Fetch every supported endpoint for an application.
+
+    The application endpoint is fetched first. If it fails (bad key, unknown
+    application, rate limiting), the other six are not requested at all.
+    Otherwise the six sub-endpoint requests are issued in parallel, so a
+    refresh costs roughly two round-trips instead of seven.
+
+    Args:
+        application_number: Application number in any format.
+
+    Returns:
+        Dict[str, Any]: Raw response per endpoint, keyed by 'application',
+        'adjustment', 'continuity', 'documents', 'assignment', 'attorney' and
+        'foreign_priority'. An endpoint that failed maps to the exception it
+        raised instead, so callers can decide which failures are fatal. When
+        the application fetch fails, only the 'application' key is present.
+    """
+    app_num = normalize_app_number(application_number)
+
+    results: Dict[str, Any] = {}
+    try:
+        results['application'] = fetch_application(app_num)
+    except Exception as e:
+        results['application'] = e
+        return results
+
+    futures = {
+        name: _FETCH_POOL.submit(fetcher, app_num)
+        for name, fetcher in _ENDPOINT_FETCHERS.items()
+        if name != 'application'
+    }
+    for name, future in futures.items():
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            results[name] = e
+    return results
+
+
+def fetch_applications_bulk(app_numbers: List[str], max_workers: int = 16) -> Dict[str, Any]:
+    """Fetch application data for many applications in parallel.
+
+    Requests are network-bound, so a thread pool over the shared session
+    overlaps them while reusing its pooled connections.
+
+    Args:
+        app_numbers: Application numbers in any format.
+        max_workers: Maximum number of concurrent requests.
+
+    Returns:
+        Dict[str, Any]: Raw `fetch_application()` response per normalized
+        application number. Applications whose fetch raised USPTOApiError map
+        to that exception instead, so one failure does not abort the batch.
+    """
+    normalized = list(dict.fromkeys(normalize_app_number(a) for a in app_numbers))
+    if not normalized:
+        return {}
+
+    results: Dict[str, Any] = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(normalized))) as pool:
+        futures = {app_num: pool.submit(fetch_application, app_num) for app_num in normalized}
+        for app_num, future in futures.items():
+            error = future.exception()
+            if error is None:
+                results[app_num] = future.result()
+            elif isinstance(error, USPTOApiError):
+                results[app_num] = error
+            else:
+                raise error
+    return results
 
 
 # Event codes that indicate significant status changes
@@ -696,6 +1049,10 @@ SIGNIFICANT_EVENT_CODES = {
     'A...': 'Amendment/Response',
 }
 
+# Exact codes and code-family prefixes used by is_significant_event
+_SIG_CODES = frozenset(SIGNIFICANT_EVENT_CODES)
+_SIG_PREFIXES = ('CT', 'NOA', 'ABN', 'ISSUE', 'RCE', 'MAIL')
+
 
 def is_significant_event(event_code: str) -> bool:
     """Check if an event code represents a significant status change.
@@ -709,14 +1066,5 @@ def is_significant_event(event_code: str) -> bool:
     Returns:
         bool: True if the code is considered significant.
     """
-    # Check exact match
-    if event_code in SIGNIFICANT_EVENT_CODES:
-        return True
-
-    # Check for partial matches (some codes have variants)
-    significant_prefixes = ['CT', 'NOA', 'ABN', 'ISSUE', 'RCE', 'MAIL']
-    for prefix in significant_prefixes:
-        if event_code.startswith(prefix):
-            return True
-
-    return False
+    # Exact match, then prefix match (some codes have variants)
+    return event_code in _SIG_CODES or event_code.startswith(_SIG_PREFIXES)
@@ -0,0 +1,40 @@
+"""Tests for the JSON helpers in src.uspto_api."""
+
+import json
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("keyring")
+
+from src import uspto_api
+
+BAGS = [
+    [],
+    None,
+    ["G06F"],
+    [{"assignorName": "Müller, José", "reelNumber": 58471, "frameNumber": 1}],
+]
+
+
+def _stdlib_round_trip(monkeypatch, value):
+    """Serialize and decode a bag with orjson disabled."""
+    with monkeypatch.context() as m:
+        m.setattr(uspto_api, "orjson", None)
+        m.setattr(uspto_api, "_loads", json.loads)
+        text = uspto_api._dumps_bag(value)
+        return text, uspto_api._loads(text)
+
+
+@pytest.mark.parametrize("value", BAGS)
+def test_dumps_bag_backends_agree(monkeypatch, value):
+    pytest.importorskip("orjson")
+    text = uspto_api._dumps_bag(value)
+
+    assert (text, uspto_api._loads(text)) == _stdlib_round_trip(monkeypatch, value)
+
+
+@pytest.mark.parametrize("value", [[], None])
+def test_dumps_bag_stores_empty_bags_as_list(monkeypatch, value):
+    assert uspto_api._dumps_bag(value) == "[]"
+    assert _stdlib_round_trip(monkeypatch, value) == ("[]", [])